@@ -0,0 +1,305 @@
+import codecs
+import json
+import os
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Source field -> Pinecone metadata key
+PART_FIELDS = {
+    'title': 'title',
+    'category': 'category',
+    'brand': 'brand',
+    'partSelectNumber': 'part_select_number',
+    'manufacturerPartNumber': 'manufacturer_part_number',
+    'description': 'description',
+    'price': 'price',
+    'imageURL': 'image_url',
+    'troubleShooting': 'troubleshooting',
+    'compatibleModels': 'compatible_models',
+    'replaces': 'replaces',
+    'rating': 'rating',
+    'installationVideoURL': 'installation_video_url'
+}
+REQUIRED_FIELDS = ('title', 'partSelectNumber')
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+_JSON_WHITESPACE = frozenset(' \t\n\r')
+# Largest single record buffered before a feed is rejected as malformed
+MAX_RECORD_BYTES = 1024 * 1024
+
+def _as_text(value: Any) -> str:
+    """Render a normalized field for search text, joining list values."""
+    if isinstance(value, list):
+        return ', '.join(value)
+    return str(value)
+
+def create_search_text(part: Dict) -> str:
+    """Create a searchable text from part metadata."""
+    return f"""
+    Title: {_as_text(part['title'])}
+    Category: {_as_text(part['category'])}
+    Brand: {_as_text(part['brand'])}
+    Description: {_as_text(part['description'])}
+    Part Number: {_as_text(part['partSelectNumber'])}
+    Manufacturer Part Number: {_as_text(part['manufacturerPartNumber'])}
+    Troubleshooting: {_as_text(part['troubleShooting'])}
+    Compatible Models: {_as_text(part['compatibleModels'])}
+    """
+
+def iter_json_array(path: str, chunk_size: int = 65536, start_offset: int = 0,
+                    max_record_bytes: int = MAX_RECORD_BYTES) -> Iterator[Tuple[Any, int]]:
+    """Yield (element, end byte offset) for each element of a top-level JSON array.
+
+    Only the current read chunk and the record being decoded are held in memory;
+    an element still undecoded after max_record_bytes raises ValueError.
+    A non-zero start_offset must be an offset previously yielded by this function;
+    parsing resumes right after that element.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    with open(path, 'rb') as f:
+        f.seek(start_offset)
+        buffer = ''
+        pos = 0
+        eof = False
+        # Byte offset of buffer[mark], the end of the last yielded element
+        mark = 0
+        mark_offset = start_offset
+        # 'open': expect '['; 'first': element or ']'; 'element': element;
+        # 'separator': ',' or ']'; 'closed': only whitespace may follow
+        state = 'separator' if start_offset else 'open'
+
+        def read_more():
+            nonlocal buffer, pos, mark, eof
+            raw = f.read(chunk_size)
+            eof = not raw
+            buffer = buffer[mark:] + utf8.decode(raw, final=eof)
+            pos -= mark
+            mark = 0
+
+        def read_more_element():
+            # Called while an element is incomplete, so cap how much of it is buffered
+            if len(buffer) - mark > max_record_bytes:
+                raise error(f"JSON element exceeds {max_record_bytes} bytes")
+            read_more()
+
+        def error(message):
+            return ValueError(f"{path}: {message} at byte {mark_offset + len(buffer[mark:pos].encode('utf-8'))}")
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+                pos += 1
+
+            if pos == len(buffer):
+                if eof:
+                    if state == 'closed':
+                        return
+                    raise error("unexpected end of file inside JSON array")
+                # Everything buffered is consumed, so drop it before reading on
+                mark_offset += len(buffer[mark:pos].encode('utf-8'))
+                mark = pos
+                read_more()
+                continue
+
+            char = buffer[pos]
+            if state == 'closed':
+                raise error("unexpected data after JSON array")
+            if state == 'open':
+                if char != '[':
+                    raise error("expected a JSON array of parts")
+                state = 'first'
+                pos += 1
+                continue
+            if state == 'separator':
+                if char == ',':
+                    state = 'element'
+                elif char == ']':
+                    state = 'closed'
+                else:
+                    raise error("expected ',' or ']'")
+                pos += 1
+                continue
+            if char in ',]':
+                if char == ']' and state == 'first':
+                    state = 'closed'
+                    pos += 1
+                    continue
+                raise error("expected a JSON value")
+
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The element may run past the buffer; only EOF makes it malformed
+                if eof:
+                    raise error("malformed JSON element")
+                read_more_element()
+                continue
+
+            # A value is complete only once the next token is visible and is ',' or ']'
+            follow = end
+            while follow < len(buffer) and buffer[follow] in _JSON_WHITESPACE:
+                follow += 1
+            if follow == len(buffer):
+                if eof:
+                    raise error("unexpected end of file inside JSON array")
+                read_more_element()
+                continue
+            if buffer[follow] not in ',]':
+                # A number cut off at the chunk boundary ("4." + "5") decodes as its prefix
+                if not eof and follow == end and all(c in _NUMBER_CHARS for c in buffer[end:]):
+                    read_more_element()
+                    continue
+                raise error("expected ',' or ']'")
+
+            mark_offset += len(buffer[mark:end].encode('utf-8'))
+            mark = pos = end
+            state = 'separator'
+            yield element, mark_offset
+
+def iter_json_lines(path: str, start_offset: int = 0,
+                    max_record_bytes: int = MAX_RECORD_BYTES) -> Iterator[Tuple[Any, int]]:
+    """Yield (record, end byte offset) for each non-empty line of a JSON Lines file.
+
+    A line longer than max_record_bytes raises ValueError without being read in full.
+    """
+    offset = start_offset
+    with open(path, 'rb') as f:
+        f.seek(start_offset)
+        for line in iter(lambda: f.readline(max_record_bytes + 1), b''):
+            line_start = offset
+            offset += len(line)
+            if len(line) > max_record_bytes and not line.endswith(b'\n'):
+                raise ValueError(f"{path}: JSON line exceeds {max_record_bytes} bytes at byte {line_start}")
+            if not line.strip(b' \t\n\r'):
+                continue
+            try:
+                yield json.loads(line), offset
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                raise ValueError(f"{path}: malformed JSON line at byte {line_start}: {e}") from e
+
+def iter_part_records(path: str, start_offset: int = 0,
+                      max_record_bytes: int = MAX_RECORD_BYTES) -> Iterator[Tuple[Any, int]]:
+    """Stream (raw part record, end byte offset) from a .json array or .jsonl file."""
+    if path.endswith(('.jsonl', '.ndjson')):
+        return iter_json_lines(path, start_offset, max_record_bytes)
+    return iter_json_array(path, start_offset=start_offset, max_record_bytes=max_record_bytes)
+
+def _normalize_value(value: Any) -> Any:
+    """Strip strings and keep lists as lists of strings, which Pinecone accepts as metadata."""
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return [str(item).strip() for item in value if item is not None]
+    return str(value).strip()
+
+def normalize_part(part: Any) -> Optional[Dict]:
+    """Validate a raw part record and fill in missing optional fields.
+
+    Returns None if the record is not an object or lacks a required field.
+    """
+    if not isinstance(part, dict):
+        return None
+
+    normalized = {}
+    for field in PART_FIELDS:
+        value = part.get(field)
+        if field == 'rating':
+            try:
+                normalized[field] = float(value)
+            except (TypeError, ValueError):
+                normalized[field] = 0.0
+        else:
+            normalized[field] = _normalize_value(value)
+
+    if any(not isinstance(normalized[field], str) or not normalized[field] for field in REQUIRED_FIELDS):
+        return None
+    return normalized
+
+def batched(items: Iterable, size: int) -> Iterator[List]:
+    """Group an iterable into lists of at most `size` items."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def load_checkpoint(path: str) -> Dict[str, Dict]:
+    """Load per-file progress: byte offset, next record id and whether the file is done."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f).get('files', {})
+
+def save_checkpoint(path: str, progress: Dict[str, Dict]):
+    """Atomically write per-file progress so an interrupted run can resume."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({'files': progress}, f)
+    os.replace(tmp_path, path)
+
+def iter_vectors(files: List[str], progress: Dict[str, Dict],
+                 max_record_bytes: int = MAX_RECORD_BYTES) -> Iterator[Dict]:
+    """Parse and normalize parts from each file, continuing from checkpointed progress.
+
+    Every item carries the file's progress after it, and a final item per file
+    marks it done. Ids follow each record's position across all files, so a
+    resumed run writes the same ids as an uninterrupted one as long as the
+    files are given in the same order.
+    """
+    record_id = 0
+    for path in files:
+        state = progress.get(path)
+        if state:
+            record_id = state['next_id']
+            if state['done']:
+                continue
+        offset = state['offset'] if state else 0
+
+        skipped = 0
+        print(f"Streaming parts from {path}...")
+        for raw_part, offset in iter_part_records(path, offset, max_record_bytes):
+            part = normalize_part(raw_part)
+            item = {'file': path, 'offset': offset, 'next_id': record_id + 1, 'done': False, 'part': part}
+            if part is None:
+                skipped += 1
+            else:
+                item['id'] = f"part_{record_id}"
+            record_id += 1
+            yield item
+        if skipped:
+            print(f"Skipped {skipped} invalid records in {path}")
+        yield {'file': path, 'offset': offset, 'next_id': record_id, 'done': True, 'part': None}
+
+def ingest_parts(files: List[str], write_batch: Callable[[List[Dict]], None], batch_size: int = 100,
+                 checkpoint_path: Optional[str] = None, resume: bool = False,
+                 max_record_bytes: int = MAX_RECORD_BYTES) -> int:
+    """Stream valid parts to write_batch in bounded batches, checkpointing after each one.
+
+    write_batch receives the batch's valid items (each with 'id' and 'part').
+    Returns the number of parts written.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    if max_record_bytes < 1:
+        raise ValueError(f"max_record_bytes must be at least 1, got {max_record_bytes}")
+
+    progress = load_checkpoint(checkpoint_path) if checkpoint_path and resume else {}
+    if progress:
+        print(f"Resuming from checkpoint: {progress}")
+
+    written = 0
+    for batch in batched(iter_vectors(files, progress, max_record_bytes), batch_size):
+        valid = [item for item in batch if item['part'] is not None]
+        if valid:
+            write_batch(valid)
+            written += len(valid)
+
+        for item in batch:
+            progress[item['file']] = {'offset': item['offset'], 'next_id': item['next_id'], 'done': item['done']}
+        if checkpoint_path:
+            save_checkpoint(checkpoint_path, progress)
+        print(f"Indexed {written} parts...")
+
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return written
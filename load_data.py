@@ -1,9 +1,10 @@
-import json
+import argparse
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional
 from pinecone import Pinecone
 from sentence_transformers import SentenceTransformer
 from dotenv import load_dotenv
+from catalog_ingest import MAX_RECORD_BYTES, PART_FIELDS, create_search_text, ingest_parts
 
 # Load environment variables
 load_dotenv()
@@ -15,81 +16,49 @@ model = SentenceTransformer('all-MiniLM-L6-v2')  # This model has 384 dimensions
 pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
 index = pc.Index(os.getenv("PINECONE_INDEX_NAME"))
 
-def get_embedding(text: str) -> List[float]:
-    """Get embedding using sentence-transformers."""
-    return model.encode(text).tolist()
+# Catalog files indexed by default, in id order
+PART_FILES = ['fake_refrigerator_parts.json', 'fake_dishwasher_parts.json']
+CHECKPOINT_FILE = '.index_parts_checkpoint.json'
 
-def create_search_text(part: Dict) -> str:
-    """Create a searchable text from part metadata."""
-    return f"""
-    Title: {part['title']}
-    Category: {part['category']}
-    Brand: {part['brand']}
-    Description: {part['description']}
-    Part Number: {part['partSelectNumber']}
-    Manufacturer Part Number: {part['manufacturerPartNumber']}
-    Troubleshooting: {part['troubleShooting']}
-    Compatible Models: {part['compatibleModels']}
-    """
+def get_embeddings(texts: List[str]) -> List[List[float]]:
+    """Get embeddings for a batch of texts using sentence-transformers."""
+    return model.encode(texts).tolist()
 
-def index_parts():
-    """Load parts and index them in Pinecone."""
-    print("Starting indexing process...")
-    
-    # Load parts data from both JSON files
-    all_parts = []
-    
-    # Load refrigerator parts
-    print("Loading refrigerator parts...")
-    with open('fake_refrigerator_parts.json', 'r') as f:
-        refrigerator_parts = json.load(f)
-        all_parts.extend(refrigerator_parts)
-    print(f"Loaded {len(refrigerator_parts)} refrigerator parts")
-    
-    # Load dishwasher parts
-    print("Loading dishwasher parts...")
-    with open('fake_dishwasher_parts.json', 'r') as f:
-        dishwasher_parts = json.load(f)
-        all_parts.extend(dishwasher_parts)
-    print(f"Loaded {len(dishwasher_parts)} dishwasher parts")
-    
-    print(f"Total parts to index: {len(all_parts)}")
-    
-    # Index each part
-    for i, part in enumerate(all_parts):
-        search_text = create_search_text(part)
-        embedding = get_embedding(search_text)
-        
-        # Prepare metadata with all available fields
-        metadata = {
-            'title': part['title'],
-            'category': part['category'],
-            'brand': part['brand'],
-            'part_select_number': part['partSelectNumber'],
-            'manufacturer_part_number': part['manufacturerPartNumber'],
-            'description': part['description'],
-            'price': part['price'],
-            'image_url': part['imageURL'],
-            'troubleshooting': part['troubleShooting'],
-            'compatible_models': part['compatibleModels'],
-            'replaces': part['replaces'],
-            'rating': part['rating'],
-            'installation_video_url': part['installationVideoURL']
+def upsert_parts(items: List[Dict]):
+    """Embed a batch of normalized parts and upsert them to Pinecone."""
+    embeddings = get_embeddings([create_search_text(item['part']) for item in items])
+    vectors = [
+        {
+            'id': item['id'],
+            'values': embedding,
+            'metadata': {PART_FIELDS[field]: value for field, value in item['part'].items()}
         }
-        
-        # Upsert to Pinecone
-        index.upsert(
-            vectors=[{
-                'id': f"part_{i}",
-                'values': embedding,
-                'metadata': metadata
-            }]
-        )
-        
-        if (i + 1) % 10 == 0:
-            print(f"Indexed {i + 1} parts...")
-    
+        for item, embedding in zip(items, embeddings)
+    ]
+    index.upsert(vectors=vectors)
+
+def index_parts(files: Optional[List[str]] = None, batch_size: int = 100,
+                checkpoint_path: str = CHECKPOINT_FILE, resume: bool = False,
+                max_record_bytes: int = MAX_RECORD_BYTES):
+    """Stream parts into Pinecone in bounded batches, checkpointing after each upsert."""
+    print("Starting indexing process...")
+    ingest_parts(files or PART_FILES, upsert_parts, batch_size, checkpoint_path, resume, max_record_bytes)
     print("Indexing completed!")
 
+def positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 if __name__ == "__main__":
-    index_parts() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Index part catalog files in Pinecone.")
+    parser.add_argument('files', nargs='*', help="Part files (.json array or .jsonl); defaults to the bundled catalogs")
+    parser.add_argument('--batch-size', type=positive_int, default=100, help="Records embedded and upserted per batch")
+    parser.add_argument('--checkpoint', default=CHECKPOINT_FILE, help="Checkpoint file path")
+    parser.add_argument('--max-record-bytes', type=positive_int, default=MAX_RECORD_BYTES,
+                        help="Largest single part record accepted before the feed is rejected")
+    parser.add_argument('--resume', action='store_true', help="Skip records recorded in the checkpoint")
+    args = parser.parse_args()
+    index_parts(args.files, args.batch_size, args.checkpoint, args.resume, args.max_record_bytes)
@@ -0,0 +1,194 @@
+import json
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from catalog_ingest import (
+    create_search_text,
+    ingest_parts,
+    iter_json_array,
+    iter_json_lines,
+    normalize_part,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CATALOGS = [str(REPO_ROOT / name) for name in ('fake_refrigerator_parts.json', 'fake_dishwasher_parts.json')]
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def records(path, **kwargs):
+    return [record for record, _ in iter_json_array(path, **kwargs)]
+
+
+@pytest.mark.parametrize('catalog', CATALOGS)
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 65536])
+def test_iter_json_array_matches_json_load(catalog, chunk_size):
+    with open(catalog, 'r') as f:
+        expected = json.load(f)
+    assert records(catalog, chunk_size=chunk_size) == expected
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 4, 100])
+def test_iter_json_array_numbers_split_across_chunks(tmp_path, chunk_size):
+    path = write(tmp_path, 'numbers.json', '[1e5, 4.5 ,-12, "é☃", {"a": [1, 2]}]\n')
+    assert records(path, chunk_size=chunk_size) == [1e5, 4.5, -12, 'é☃', {'a': [1, 2]}]
+
+
+def test_iter_json_array_empty(tmp_path):
+    assert records(write(tmp_path, 'empty.json', ' [ ] ')) == []
+
+
+@pytest.mark.parametrize('text', [
+    '[,,1,,]',
+    '[1,,2]',
+    '[1,]',
+    '[,1]',
+    '[1 2]',
+    '[1]garbage',
+    '[\u00a01\u00a0]',
+    '[1]\u2028',
+    '[\x1c1]',
+    '[1, 2',
+    '[{"a": 1}',
+    '{"a": 1}',
+    '',
+])
+@pytest.mark.parametrize('chunk_size', [1, 3, 65536])
+def test_iter_json_array_rejects_invalid_json(tmp_path, text, chunk_size):
+    path = write(tmp_path, 'bad.json', text)
+    with pytest.raises(ValueError):
+        records(path, chunk_size=chunk_size)
+
+
+def test_iter_json_array_rejects_malformed_element_without_buffering_file(tmp_path):
+    good = json.dumps({'title': 'x' * 1000, 'partSelectNumber': 'PS1'})
+    path = write(tmp_path, 'large.json', '[{"title": "bad",}' + f', {good}' * 10000 + ']')
+    tracemalloc.start()
+    try:
+        with pytest.raises(ValueError, match='exceeds 65536 bytes'):
+            records(path, max_record_bytes=65536)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 1024 * 1024
+
+
+def test_iter_json_array_accepts_records_up_to_limit(tmp_path):
+    record = {'title': 'x' * 5000}
+    path = write(tmp_path, 'big.json', '[' + ', '.join([json.dumps(record)] * 3) + ']')
+    assert records(path, chunk_size=100, max_record_bytes=6000) == [record] * 3
+    with pytest.raises(ValueError, match='exceeds'):
+        records(path, chunk_size=100, max_record_bytes=1000)
+
+
+def test_iter_json_array_resumes_from_offset():
+    catalog = CATALOGS[0]
+    full = list(iter_json_array(catalog, chunk_size=7))
+    _, offset = full[41]
+    assert [r for r, _ in iter_json_array(catalog, start_offset=offset)] == [r for r, _ in full[42:]]
+
+
+def test_iter_json_lines_skips_blank_lines_and_resumes(tmp_path):
+    path = write(tmp_path, 'parts.jsonl', '{"a": 1}\n\n   \n{"a": 2}\n{"a": 3}')
+    lines = list(iter_json_lines(path))
+    assert [record for record, _ in lines] == [{'a': 1}, {'a': 2}, {'a': 3}]
+    assert [record for record, _ in iter_json_lines(path, lines[0][1])] == [{'a': 2}, {'a': 3}]
+
+
+def test_iter_json_lines_rejects_bad_line(tmp_path):
+    path = write(tmp_path, 'parts.jsonl', '{"a": 1}\n{"a": \n')
+    with pytest.raises(ValueError, match='byte 9'):
+        list(iter_json_lines(path))
+
+
+def test_iter_json_lines_rejects_overlong_line(tmp_path):
+    path = write(tmp_path, 'parts.jsonl', '{"a": 1}\n' + json.dumps({'a': 'x' * 100}) + '\n')
+    assert len(list(iter_json_lines(path, max_record_bytes=200))) == 2
+    with pytest.raises(ValueError, match='exceeds 50 bytes at byte 9'):
+        list(iter_json_lines(path, max_record_bytes=50))
+
+
+def make_part(**overrides):
+    part = {'title': 'Door Gasket', 'partSelectNumber': 'PS123'}
+    part.update(overrides)
+    return part
+
+
+@pytest.mark.parametrize('part', [
+    {'title': 'Door Gasket'},
+    {'partSelectNumber': 'PS123'},
+    make_part(title=''),
+    make_part(partSelectNumber='   '),
+    make_part(partSelectNumber=None),
+    make_part(title=['Door Gasket']),
+    ['not', 'a', 'part'],
+])
+def test_normalize_part_rejects_missing_required_fields(part):
+    assert normalize_part(part) is None
+
+
+def test_normalize_part_fills_defaults_and_keeps_lists():
+    part = normalize_part(make_part(title=' Door Gasket ', rating='bad', compatibleModels=['WDT780', 'GDF530']))
+    assert part['title'] == 'Door Gasket'
+    assert part['brand'] == ''
+    assert part['rating'] == 0.0
+    assert part['compatibleModels'] == ['WDT780', 'GDF530']
+    assert 'Compatible Models: WDT780, GDF530' in create_search_text(part)
+
+
+def jsonl_catalog(tmp_path):
+    lines = [json.dumps(make_part(partSelectNumber=f'PS{i}')) for i in range(5)]
+    lines.insert(2, json.dumps({'title': 'no part number'}))
+    return write(tmp_path, 'extra.jsonl', '\n'.join(lines) + '\n')
+
+
+def test_resumed_run_writes_same_ids(tmp_path):
+    files = CATALOGS + [jsonl_catalog(tmp_path)]
+    checkpoint = str(tmp_path / 'checkpoint.json')
+
+    uninterrupted = []
+    ingest_parts(files, lambda items: uninterrupted.extend(item['id'] for item in items), batch_size=30)
+
+    written = []
+
+    def fail_after_four_batches(items):
+        if len(written) >= 4 * 30:
+            raise RuntimeError('interrupted')
+        written.extend(item['id'] for item in items)
+
+    with pytest.raises(RuntimeError):
+        ingest_parts(files, fail_after_four_batches, batch_size=30, checkpoint_path=checkpoint)
+    ingest_parts(files, lambda items: written.extend(item['id'] for item in items),
+                 batch_size=30, checkpoint_path=checkpoint, resume=True)
+
+    assert uninterrupted == [f'part_{i}' for i in range(206) if i != 202]
+    assert written == uninterrupted
+    assert not (tmp_path / 'checkpoint.json').exists()
+
+
+def test_resume_skips_finished_files_without_opening_them(tmp_path):
+    checkpoint = str(tmp_path / 'checkpoint.json')
+    progress = {
+        str(tmp_path / 'missing.json'): {'offset': 0, 'next_id': 100, 'done': True},
+    }
+    with open(checkpoint, 'w') as f:
+        json.dump({'files': progress}, f)
+
+    ids = []
+    ingest_parts([str(tmp_path / 'missing.json'), CATALOGS[1]], lambda items: ids.extend(item['id'] for item in items),
+                 checkpoint_path=checkpoint, resume=True)
+    assert ids == [f'part_{i}' for i in range(100, 200)]
+
+
+@pytest.mark.parametrize('batch_size', [0, -1])
+def test_invalid_batch_size_keeps_checkpoint(tmp_path, batch_size):
+    checkpoint = write(tmp_path, 'checkpoint.json', '{"files": {}}')
+    with pytest.raises(ValueError):
+        ingest_parts(CATALOGS, lambda items: None, batch_size=batch_size, checkpoint_path=checkpoint, resume=True)
+    assert (tmp_path / 'checkpoint.json').exists()